@@ -17,6 +17,7 @@ from app.models.auth import TokenData
 from app.services.firebase import firebase_service
 from app.services.scoring import get_score_interpretation
 from app.dependencies.auth import get_current_user, verify_patient_access
+from app.dependencies.llm import ReportGenerator, get_report_generator
 from app.config.settings import settings
 
 router = APIRouter()
@@ -41,7 +42,10 @@ async def verify_mock_token(token: str, patient_id: str) -> dict:
 
 
 @router.post("/submit", response_model=SurveySubmitResponse)
-async def submit_survey(request: SurveySubmitRequest):
+async def submit_survey(
+    request: SurveySubmitRequest,
+    generate_report: ReportGenerator = Depends(get_report_generator),
+):
     """
     Process and store a patient's survey response
     """
@@ -100,7 +104,7 @@ async def submit_survey(request: SurveySubmitRequest):
                 rating_result=request.responses,
                 scale_name=backend_survey_type,
                 gender=gender,
-                generate_llm_report=True,
+                generate_llm_report=False,
             )
 
             # Check for scoring errors
@@ -112,6 +116,11 @@ async def submit_survey(request: SurveySubmitRequest):
                     "interpretation": "Scoring not available for this survey type",
                     "llm_report": "Survey data has been recorded, but scoring is not available for this survey type.",
                 }
+            else:
+                # Write the LLM report with the injected generator
+                score_result["llm_report"] = await generate_report(
+                    request.responses, backend_survey_type, score_result
+                )
         else:
             # For demographic and past history, just store without scoring
             score_result = {
@@ -330,7 +339,7 @@ async def test_llm_connection():
     Test LLM connection and API key configuration
     """
     try:
-        from app.services.llm import generate_report
+        from app.services.llm import generate_report_async
         from app.config.settings import settings
 
         # Check if API key is configured
@@ -352,10 +361,12 @@ async def test_llm_connection():
         }
 
         # Try to generate a report
-        report = generate_report(
+        report = await generate_report_async(
             rating_result=test_rating_result,
             scale_name="TEST",
             score_interpretation=test_score_interpretation,
+            # Always hit the LLM: a cached report says nothing about connectivity
+            use_cache=False,
         )
 
         # Check if it's a fallback report or actual LLM response
@@ -0,0 +1,20 @@
+"""
+LLM dependencies for report generation
+"""
+
+from typing import Awaitable, Callable
+
+from app.services.llm import generate_report_async
+
+# (rating_result, scale_name, score_interpretation) -> Markdown report
+ReportGenerator = Callable[[dict, str, dict], Awaitable[str]]
+
+
+def get_report_generator() -> ReportGenerator:
+    """
+    Get the coroutine function used to write survey reports
+
+    Returns:
+        ReportGenerator: Async report generator backed by the LLM service
+    """
+    return generate_report_async
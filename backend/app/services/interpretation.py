@@ -1,58 +1,147 @@
 import json
+import os
+from functools import lru_cache
 
+from app.utils.helpers import build_range_index, find_range
 
-def interpret_rating_scale(
-    assessment_name, score, gender=None, additional_conditions=None
-):
+# Scoring criteria file, shared with the scoring service
+CRITERIA_PATH = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)),
+    "..",
+    "references",
+    "scoring_criteria.json",
+)
+
+
+def _criteria_mtime(path):
+    """Modification time of the criteria file, or None if it cannot be stat'ed."""
+    try:
+        return os.path.getmtime(path)
+    except OSError:
+        return None
+
+
+def _prebuilt_results(criteria):
     """
-    Interpret the rating scale result based on the provided JSON criteria.
+    Build the result dict for each criterion once, at load time.
 
-    Args:
-        assessment_name (str): Name of the assessment (e.g., "BDI", "AUDIT").
-        score (int): The score to evaluate.
-        gender (str, optional): Gender ("남" or "여") for assessments like AUDIT.
-        additional_conditions (dict, optional): Additional conditions (e.g., {"simultaneity": "예"}).
+    The dicts are shared between calls; _finish hands out copies.
+    """
+    return [
+        {"category": criterion["category"], "description": criterion["description"]}
+        for criterion in criteria
+    ]
 
-    Returns:
-        dict: Result containing category and description, or error message.
+
+def _build_range_table(criteria):
     """
-    # Load the JSON data (assumed to be in a file or string for this example)
-    with open("app/reference/scoring_criteria.json", "r", encoding="utf-8") as f:
-        data = json.load(f)
+    Build (range index, results) for a range-only criteria list.
+
+    Returns None unless every criterion is a range and the ranges are sorted and
+    disjoint, so that bisect finds the same criterion as a first-match scan.
+    """
+    if not all("range" in criterion for criterion in criteria):
+        return None
+
+    index = build_range_index(criterion["range"] for criterion in criteria)
+    if index is None:
+        return None
+    return index, _prebuilt_results(criteria)
+
+
+def _match_range(table, score):
+    """Return the result whose range contains score, or None if it falls in a gap."""
+    index, results = table
+    i = find_range(index, score)
+    return None if i is None else results[i]
+
+
+def _scan_ranges(criteria, results, score):
+    """Return the result of the first criterion whose range contains score, or None."""
+    for criterion, result in zip(criteria, results):
+        range_min = criterion["range"][0]
+        range_max = (
+            criterion["range"][1] if criterion["range"][1] is not None else float("inf")
+        )
+        if range_min <= score <= range_max:
+            return result
+    return None
+
+
+def _range_matcher(criteria):
+    """Return match(score) for a range criteria list, using bisect when possible."""
+    table = _build_range_table(criteria)
+    if table is not None:
+        return lambda score: _match_range(table, score)
+    results = _prebuilt_results(criteria)
+    return lambda score: _scan_ranges(criteria, results, score)
+
+
+def _finish(assessment, result):
+    """Copy the prebuilt result of the matched criterion (or None if nothing matched)."""
+    if result is not None and result["category"]:
+        return result.copy()
+
+    if result is None:
+        result = {"category": None, "description": None}
+    else:
+        result = result.copy()
+
+    # If no matching criteria found
+    if not result["category"]:
+        # For threshold-based assessments, if score is below threshold, assume "normal"
+        if "threshold" in assessment["criteria"][0]:
+            result["category"] = "정상"
+            result["description"] = "점수가 임계값 미만이므로 정상으로 간주됩니다."
+        else:
+            result["error"] = "No matching criteria found for the given score."
+
+    return result
 
-    # Find the assessment by name
-    assessment = next(
-        (a for a in data["assessments"] if a["name"] == assessment_name), None
-    )
-    if not assessment:
-        return {"error": f"Assessment '{assessment_name}' not found."}
 
-    # Initialize result
-    result = {"category": None, "description": None}
+def _compile_assessment(assessment):
+    """
+    Specialize interpretation for one assessment.
+
+    Args:
+        assessment (dict): Assessment entry from the criteria JSON.
 
-    # Check if the assessment uses gender-based criteria (e.g., AUDIT)
+    Returns:
+        callable: interpret(score, gender, additional_conditions) -> dict
+    """
+    # Gender-based criteria (e.g., AUDIT)
     if "criteria_by_gender" in assessment:
-        if not gender:
-            return {"error": "Gender is required for this assessment."}
-        if gender not in assessment["criteria_by_gender"]:
-            return {"error": f"Invalid gender '{gender}'. Expected '남' or '여'."}
-
-        criteria = assessment["criteria_by_gender"][gender]
-        for criterion in criteria:
-            range_min = criterion["range"][0]
-            range_max = (
-                criterion["range"][1]
-                if criterion["range"][1] is not None
-                else float("inf")
-            )
-            if range_min <= score <= range_max:
-                result["category"] = criterion["category"]
-                result["description"] = criterion["description"]
-                break
-
-    # Check if the assessment uses regular criteria (range or threshold)
-    elif "criteria" in assessment:
-        for criterion in assessment["criteria"]:
+        branches = assessment["criteria_by_gender"]
+        matchers = {
+            branch: _range_matcher(criteria) for branch, criteria in branches.items()
+        }
+
+        def interpret(score, gender, additional_conditions):
+            if not gender:
+                return {"error": "Gender is required for this assessment."}
+            if gender not in matchers:
+                return {"error": f"Invalid gender '{gender}'. Expected '남' or '여'."}
+            return _finish(assessment, matchers[gender](score))
+
+        return interpret
+
+    # Neither gender-based nor regular criteria: nothing can match
+    if "criteria" not in assessment:
+        return lambda score, gender, additional_conditions: _finish(assessment, None)
+
+    # Range-only criteria (e.g., BDI): bisect on the precomputed upper bounds
+    table = _build_range_table(assessment["criteria"])
+    if table is not None:
+        return lambda score, gender, additional_conditions: _finish(
+            assessment, _match_range(table, score)
+        )
+
+    # Regular criteria mixing ranges and thresholds (e.g., K-MDQ, OCI-R)
+    criteria = assessment["criteria"]
+    results = _prebuilt_results(criteria)
+
+    def interpret(score, gender, additional_conditions):
+        for criterion, result in zip(criteria, results):
             # Handle range-based criteria
             if "range" in criterion:
                 range_min = criterion["range"][0]
@@ -62,9 +151,7 @@ def interpret_rating_scale(
                     else float("inf")
                 )
                 if range_min <= score <= range_max:
-                    result["category"] = criterion["category"]
-                    result["description"] = criterion["description"]
-                    break
+                    return _finish(assessment, result)
             # Handle threshold-based criteria (e.g., K-MDQ, OCI-R)
             elif "threshold" in criterion:
                 if score >= criterion["threshold"]:
@@ -85,20 +172,60 @@ def interpret_rating_scale(
                                 "description": f"{condition_field} 값이 '{expected_value}'이어야 하지만 '{actual_value}'입니다.",
                             }
 
-                    result["category"] = criterion["category"]
-                    result["description"] = criterion["description"]
-                    break
+                    return _finish(assessment, result)
+        return _finish(assessment, None)
 
-    # If no matching criteria found
-    if not result["category"]:
-        # For threshold-based assessments, if score is below threshold, assume "normal"
-        if "threshold" in assessment["criteria"][0]:
-            result["category"] = "정상"
-            result["description"] = "점수가 임계값 미만이므로 정상으로 간주됩니다."
-        else:
-            result["error"] = "No matching criteria found for the given score."
+    return interpret
 
-    return result
+
+@lru_cache(maxsize=4)
+def _load_criteria(path, mtime):
+    """
+    Load the criteria JSON once per (path, mtime) and compile each assessment.
+
+    Args:
+        path (str): Path to the criteria JSON file.
+        mtime (float, optional): File modification time; only part of the cache key
+            so an edited file is read again.
+
+    Returns:
+        dict: interpret(score, gender, additional_conditions) callables keyed by
+            assessment name (first entry wins on duplicates).
+    """
+    with open(path, "r", encoding="utf-8") as f:
+        data = json.load(f)
+
+    interpreters = {}
+    for assessment in data["assessments"]:
+        if assessment["name"] not in interpreters:
+            interpreters[assessment["name"]] = _compile_assessment(assessment)
+    return interpreters
+
+
+def interpret_rating_scale(
+    assessment_name, score, gender=None, additional_conditions=None
+):
+    """
+    Interpret the rating scale result based on the provided JSON criteria.
+
+    Args:
+        assessment_name (str): Name of the assessment (e.g., "BDI", "AUDIT").
+        score (int): The score to evaluate.
+        gender (str, optional): Gender ("남" or "여") for assessments like AUDIT.
+        additional_conditions (dict, optional): Additional conditions (e.g., {"simultaneity": "예"}).
+
+    Returns:
+        dict: Result containing category and description, or error message.
+    """
+    # Load the compiled assessments (parsed once and reused until the file changes)
+    interpreters = _load_criteria(CRITERIA_PATH, _criteria_mtime(CRITERIA_PATH))
+
+    # Find the assessment by name
+    interpret = interpreters.get(assessment_name)
+    if not interpret:
+        return {"error": f"Assessment '{assessment_name}' not found."}
+
+    return interpret(score, gender, additional_conditions)
 
 
 # Example usage:
@@ -7,11 +7,16 @@ from app.services.firebase import firebase_service
 
 import httpx
 from typing import Dict, Any
+from collections import OrderedDict
 from datetime import datetime, timedelta
+import hashlib
 import json
 
 # Cache for storing generated summaries
 _summary_cache = {}
+# LRU cache for storing generated single-scale reports
+_report_cache: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+_REPORT_CACHE_MAXSIZE = 256
 _CACHE_EXPIRY = timedelta(hours=24)  # Cache expires after 24 hours
 
 
@@ -21,53 +26,62 @@ API_URL = (
 )
 
 
+def _extract_text(response_data: dict):
+    """Return the first non-empty text part of a Gemini response, if any"""
+    if "candidates" in response_data and response_data["candidates"]:
+        candidate = response_data["candidates"][0]
+        if "content" in candidate and "parts" in candidate["content"]:
+            if candidate["content"]["parts"]:
+                text_response = candidate["content"]["parts"][0].get("text", "")
+                if text_response.strip():
+                    print(f"[DEBUG] LLM response length: {len(text_response)}")
+                    return text_response
+    return None
+
+
+def _response_text(response: httpx.Response, attempt: int):
+    """Return the report text of one LLM response, or None if it should be retried"""
+    print(f"[DEBUG] Response status: {response.status_code} (attempt {attempt + 1})")
+    if response.status_code != 200:
+        print(f"[DEBUG] API Error: {response.text}")
+        return None
+    text_response = _extract_text(response.json())
+    if not text_response:
+        print("[DEBUG] No valid content in response (retrying if possible)")
+    return text_response
+
+
 def call_llm_with_retry(payload, headers, max_retries=1):
     for attempt in range(max_retries + 1):
         try:
             with httpx.Client(timeout=30.0) as client:
                 response = client.post(API_URL, json=payload, headers=headers)
-                print(
-                    f"[DEBUG] Response status: {response.status_code} (attempt {attempt + 1})"
-                )
-                if response.status_code != 200:
-                    print(f"[DEBUG] API Error: {response.text}")
-                    continue
-                response_data = response.json()
-                print(f"[DEBUG] Response data keys: {response_data.keys()}")
-                print(f"[DEBUG] Response data: {response.text}")
-                if "candidates" in response_data and response_data["candidates"]:
-                    candidate = response_data["candidates"][0]
-                    if "content" in candidate and "parts" in candidate["content"]:
-                        if candidate["content"]["parts"]:
-                            text_response = candidate["content"]["parts"][0].get(
-                                "text", ""
-                            )
-                            if text_response.strip():
-                                print(
-                                    f"[DEBUG] LLM response length: {len(text_response)}"
-                                )
-                                return text_response
-                print("[DEBUG] No valid content in response (retrying if possible)")
+                text_response = _response_text(response, attempt)
+                if text_response:
+                    return text_response
         except Exception as e:
             print(f"[DEBUG] LLM 호출 실패 (attempt {attempt + 1}): {e}")
     return None
 
 
-def generate_report(rating_result: dict, scale_name: str, score_interpretation: dict):
-    """
-    Generate a comprehensive medical report using LLM
-
-    Args:
-        scale_name: Name of the assessment scale
-        score_interpretation: Scoring results from get_score_interpretation
+async def call_llm_with_retry_async(payload, headers, max_retries=1):
+    """Non-blocking counterpart of call_llm_with_retry for use inside the event loop"""
+    async with httpx.AsyncClient(timeout=30.0) as client:
+        for attempt in range(max_retries + 1):
+            try:
+                response = await client.post(API_URL, json=payload, headers=headers)
+                text_response = _response_text(response, attempt)
+                if text_response:
+                    return text_response
+            except Exception as e:
+                print(f"[DEBUG] LLM 호출 실패 (attempt {attempt + 1}): {e}")
+    return None
 
-    Returns:
-        Markdown formatted report
-    """
-    if not settings.GOOGLE_API_KEY:
-        print("[DEBUG] GOOGLE_API_KEY is not set")
-        return generate_fallback_report(scale_name, score_interpretation)
 
+def _build_report_prompt(
+    rating_result: dict, scale_name: str, score_interpretation: dict
+) -> str:
+    """Build the LLM prompt for a single-scale report"""
     # Build detailed prompt with all available data
     subscores_text = ""
     if "subscores" in score_interpretation:
@@ -118,8 +132,12 @@ def generate_report(rating_result: dict, scale_name: str, score_interpretation:
 
     """
 
-    # Prepare request payload
-    payload = {
+    return prompt
+
+
+def _build_payload(prompt: str) -> dict:
+    """Wrap a prompt in a Gemini request payload"""
+    return {
         "contents": [{"parts": [{"text": prompt}]}],
         "generationConfig": {
             "temperature": 0.7,
@@ -127,24 +145,170 @@ def generate_report(rating_result: dict, scale_name: str, score_interpretation:
         },
     }
 
-    headers = {
+
+def _build_report_payload(
+    rating_result: dict, scale_name: str, score_interpretation: dict
+) -> dict:
+    """Build the Gemini request payload for a single-scale report"""
+    return _build_payload(
+        _build_report_prompt(rating_result, scale_name, score_interpretation)
+    )
+
+
+def _api_headers() -> dict:
+    return {
         "Content-Type": "application/json",
         "X-Goog-Api-Key": settings.GOOGLE_API_KEY,
     }
 
+
+def _report_cache_key(
+    rating_result: dict, scale_name: str, score_interpretation: dict
+) -> str:
+    """SHA-256 of the report inputs, so distinct patients' ratings never share a key"""
+    serialized = json.dumps(
+        [scale_name, rating_result, score_interpretation],
+        sort_keys=True,
+        default=str,
+    )
+    return hashlib.sha256(serialized.encode("utf-8")).hexdigest()
+
+
+def _is_expired(cached_data: dict, now: datetime) -> bool:
+    return now - cached_data["timestamp"] >= _CACHE_EXPIRY
+
+
+def _get_cached_report(cache_key: str):
+    cached_data = _report_cache.get(cache_key)
+    if cached_data is None:
+        return None
+    if _is_expired(cached_data, datetime.now()):
+        del _report_cache[cache_key]
+        return None
+    _report_cache.move_to_end(cache_key)
+    return cached_data["report"]
+
+
+def _cache_report(cache_key: str, report: str):
+    now = datetime.now()
+    _report_cache[cache_key] = {"report": report, "timestamp": now}
+    _report_cache.move_to_end(cache_key)
+
+    # Drop expired reports, then the least recently used ones beyond the limit
+    for key in [key for key, data in _report_cache.items() if _is_expired(data, now)]:
+        del _report_cache[key]
+    while len(_report_cache) > _REPORT_CACHE_MAXSIZE:
+        _report_cache.popitem(last=False)
+
+
+_REPORT_DISCLAIMER = "\n\n\n\n주의: 이 보고서는 자동 생성된 보고서입니다. 보다 자세한 분석을 위해서는 전문의와 상담하시기 바랍니다."
+
+
+def _report_without_llm(
+    rating_result: dict, scale_name: str, score_interpretation: dict, use_cache: bool
+):
+    """
+    Resolve a report that needs no LLM call.
+
+    Returns:
+        tuple: (cache_key, report). report is the fallback report when no API key
+            is configured, a cached report if one is fresh, and None otherwise.
+            cache_key is None when the cache is bypassed.
+    """
+    if not settings.GOOGLE_API_KEY:
+        print("[DEBUG] GOOGLE_API_KEY is not set")
+        return None, generate_fallback_report(scale_name, score_interpretation)
+    if not use_cache:
+        return None, None
+
+    # Identical ratings produce the same report, so reuse a recent one
+    cache_key = _report_cache_key(rating_result, scale_name, score_interpretation)
+    return cache_key, _get_cached_report(cache_key)
+
+
+def _finish_report(
+    cache_key: str, text_response, scale_name: str, score_interpretation: dict
+) -> str:
+    """Cache and return the LLM report, or fall back if the LLM gave nothing"""
+    if not text_response:
+        print("[DEBUG] No valid content in response after retry")
+        return generate_fallback_report(scale_name, score_interpretation)
+
+    report = text_response + _REPORT_DISCLAIMER
+    # Cache the successful response
+    if cache_key is not None:
+        _cache_report(cache_key, report)
+    return report
+
+
+def generate_report(
+    rating_result: dict,
+    scale_name: str,
+    score_interpretation: dict,
+    use_cache: bool = True,
+):
+    """
+    Generate a comprehensive medical report using LLM
+
+    Args:
+        scale_name: Name of the assessment scale
+        score_interpretation: Scoring results from get_score_interpretation
+        use_cache: Reuse and store reports in the report cache
+
+    Returns:
+        Markdown formatted report
+    """
+    cache_key, report = _report_without_llm(
+        rating_result, scale_name, score_interpretation, use_cache
+    )
+    if report:
+        return report
+
+    payload = _build_report_payload(rating_result, scale_name, score_interpretation)
+
     try:
         print(f"[DEBUG] Making request to {API_URL}")
-        text_response = call_llm_with_retry(payload, headers, max_retries=1)
-        if text_response:
-            return (
-                text_response
-                + "\n\n\n\n주의: 이 보고서는 자동 생성된 보고서입니다. 보다 자세한 분석을 위해서는 전문의와 상담하시기 바랍니다."
-            )
-        print("[DEBUG] No valid content in response after retry")
+        text_response = call_llm_with_retry(payload, _api_headers(), max_retries=1)
+    except Exception as e:
+        print(f"[DEBUG] LLM 호출 실패: {e}")
         return generate_fallback_report(scale_name, score_interpretation)
+    return _finish_report(cache_key, text_response, scale_name, score_interpretation)
+
+
+async def generate_report_async(
+    rating_result: dict,
+    scale_name: str,
+    score_interpretation: dict,
+    use_cache: bool = True,
+):
+    """
+    Async version of generate_report that does not block the event loop
+
+    Args:
+        scale_name: Name of the assessment scale
+        score_interpretation: Scoring results from get_score_interpretation
+        use_cache: Reuse and store reports in the report cache
+
+    Returns:
+        Markdown formatted report
+    """
+    cache_key, report = _report_without_llm(
+        rating_result, scale_name, score_interpretation, use_cache
+    )
+    if report:
+        return report
+
+    payload = _build_report_payload(rating_result, scale_name, score_interpretation)
+
+    try:
+        print(f"[DEBUG] Making request to {API_URL}")
+        text_response = await call_llm_with_retry_async(
+            payload, _api_headers(), max_retries=1
+        )
     except Exception as e:
         print(f"[DEBUG] LLM 호출 실패: {e}")
         return generate_fallback_report(scale_name, score_interpretation)
+    return _finish_report(cache_key, text_response, scale_name, score_interpretation)
 
 
 def generate_fallback_report(scale_name: str, score_interpretation: dict) -> str:
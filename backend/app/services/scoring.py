@@ -1,9 +1,12 @@
 import json
+import math
+from dataclasses import dataclass
 
 # 모듈 import 처리
 try:
     # 패키지 내에서 import 시 (상대 import)
     from .psqi_scoring import calculate_psqi_score, evaluate_psqi
+    from ..utils.helpers import build_range_index, find_range
     from .llm import generate_report
 except ImportError:
     # 직접 실행 시 (절대 import)
@@ -12,6 +15,7 @@ except ImportError:
 
     sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
     from app.services.psqi_scoring import calculate_psqi_score, evaluate_psqi
+    from app.utils.helpers import build_range_index, find_range
     from app.services.llm import generate_report
 
 import os
@@ -23,6 +27,109 @@ json_file_path = os.path.join(current_dir, "..", "references", "scoring_criteria
 with open(json_file_path, "r", encoding="utf-8") as f:
     diagnostic_criteria = json.load(f)
 
+# 도구 이름으로 채점 기준을 바로 찾을 수 있도록 미리 색인
+_TOOL_INDEX = {tool["name"]: tool for tool in diagnostic_criteria["assessments"]}
+
+# additional_condition의 boolean 비교에 쓰이는 참/거짓 표현 (문자열은 소문자로 정규화 후 비교)
+_TRUTHY = frozenset((True, 1, "true", "1"))
+_FALSY = frozenset((False, 0, "false", "0", None, ""))
+
+# 응답에서 가장 흔한 한 자리 숫자 문자열은 int() 파싱 없이 바로 값으로 변환
+_DIGIT_VALUES = {str(digit): digit for digit in range(10)}
+
+
+_RANGE_RULE = 0
+_THRESHOLD_RULE = 1
+
+
+@dataclass(frozen=True, slots=True)
+class _Rule:
+    """채점 기준 한 항목을 import 시점에 변환해 둔 형태"""
+
+    kind: int
+    # range 규칙은 (하한, 상한), threshold 규칙은 (임계값, inf)
+    lo: float
+    hi: float
+    label: str
+    condition: dict | None = None
+
+
+def _compile_rules(rules: list) -> tuple:
+    """채점 기준 dict 목록을 _Rule 튜플로 변환 (적용될 수 없는 항목은 제외)"""
+    compiled = []
+    for rule in rules:
+        label = rule.get("category", "") + " - " + rule.get("description", "")
+        if rule.get("range"):
+            min_score, max_score = rule["range"]
+            compiled.append(
+                _Rule(
+                    _RANGE_RULE,
+                    min_score,
+                    math.inf if max_score is None else max_score,
+                    label,
+                )
+            )
+        elif rule.get("threshold"):
+            compiled.append(
+                _Rule(
+                    _THRESHOLD_RULE,
+                    rule["threshold"],
+                    math.inf,
+                    label,
+                    rule.get("additional_condition") or None,
+                )
+            )
+    return tuple(compiled)
+
+
+def _range_index(rules: tuple):
+    """규칙이 모두 range이고 정렬되어 겹치지 않으면 이진 탐색용 색인을, 아니면 None을 반환"""
+    if not all(rule.kind == _RANGE_RULE for rule in rules):
+        return None
+    return build_range_index((rule.lo, rule.hi) for rule in rules)
+
+
+# (도구 이름, 성별 또는 None) -> (변환된 규칙, range 색인 또는 None)
+_COMPILED_RULES = {}
+for _tool in diagnostic_criteria["assessments"]:
+    if "criteria_by_gender" in _tool:
+        _rule_sets = {
+            (_tool["name"], gender): rules
+            for gender, rules in _tool["criteria_by_gender"].items()
+        }
+    else:
+        _rule_sets = {(_tool["name"], None): _tool.get("criteria", [])}
+    for _key, _rules in _rule_sets.items():
+        _compiled = _compile_rules(_rules)
+        _COMPILED_RULES[_key] = (_compiled, _range_index(_compiled))
+
+
+def _numeric_sum(obj):
+    """Recursively accumulate numeric values in dicts/lists/values"""
+    if isinstance(obj, dict):
+        values = obj.values()
+    elif isinstance(obj, list):
+        values = obj
+    else:
+        values = (obj,)
+
+    # Convert leaves inline; only nested containers cost a recursive call
+    total = 0
+    for value in values:
+        if isinstance(value, (dict, list)):
+            total += _numeric_sum(value)
+            continue
+        digit = _DIGIT_VALUES.get(value) if type(value) is str else None
+        if digit is not None:
+            total += digit
+            continue
+        try:
+            total += int(value)
+        except (ValueError, TypeError):
+            # Non-numeric value, ignore
+            pass
+    return total
+
 
 def get_score_interpretation(
     rating_result: dict,
@@ -50,34 +157,13 @@ def get_score_interpretation(
 
     # 일반적인 도구들의 채점 기준 JSON 처리
     # 총점 계산
-    def _numeric_sum(obj):
-        """Recursively accumulate numeric values in dicts/lists/values"""
-        total = 0
-        if isinstance(obj, dict):
-            for v in obj.values():
-                total += _numeric_sum(v)
-        elif isinstance(obj, list):
-            for item in obj:
-                total += _numeric_sum(item)
-        else:
-            try:
-                total += int(obj)
-            except (ValueError, TypeError):
-                # Non-numeric value, ignore
-                pass
-        return total
-
     total_score = _numeric_sum(rating_result)
 
     # 해당 도구의 채점 기준 찾기
     print(f"[DEBUG] Looking for scale_name: '{scale_name}' in scoring criteria")
-    print(
-        f"[DEBUG] Available tools in criteria: {[t['name'] for t in diagnostic_criteria['assessments']]}"
-    )
+    print(f"[DEBUG] Available tools in criteria: {list(_TOOL_INDEX)}")
 
-    tool = next(
-        (t for t in diagnostic_criteria["assessments"] if t["name"] == scale_name), None
-    )
+    tool = _TOOL_INDEX.get(scale_name)
     if not tool:
         return {"error": f"지원되지 않는 도구: {scale_name}"}
 
@@ -100,30 +186,25 @@ def get_score_interpretation(
             f"[DEBUG] No gender-based criteria for {scale_name}, using general criteria"
         )
 
-    scoring_rules = category if category else tool.get("criteria", [])
-
     # 총점에 따른 해석 찾기
     interpretation = None
+    rule_key = (scale_name, gender if "criteria_by_gender" in tool else None)
+    scoring_rules, range_index = _COMPILED_RULES.get(rule_key, ((), None))
+    if range_index is not None:
+        # range만 있는 도구는 이진 탐색으로 구간을 찾음
+        position = find_range(range_index, total_score)
+        if position is not None:
+            interpretation = scoring_rules[position].label
+        scoring_rules = ()
     for rule in scoring_rules:
-        if rule.get("range"):
-            # Handle cases where upper bound might be None/null (represents infinity)
-            min_score = rule["range"][0]
-            max_score = rule["range"][1]
-
-            if max_score is None:
-                # No upper limit
-                if total_score >= min_score:
-                    interpretation = rule["category"] + " - " + rule["description"]
-                    break
-            else:
-                # Normal range check
-                if min_score <= total_score <= max_score:
-                    interpretation = rule["category"] + " - " + rule["description"]
-                    break
-        elif rule.get("threshold") and total_score >= rule["threshold"]:
-            interpretation = rule["category"] + " - " + rule["description"]
-            if rule.get("additional_condition"):
-                condition = rule["additional_condition"]
+        if rule.kind == _RANGE_RULE:
+            if rule.lo <= total_score <= rule.hi:
+                interpretation = rule.label
+                break
+        elif total_score >= rule.lo:
+            interpretation = rule.label
+            if rule.condition:
+                condition = rule.condition
                 field_name = condition["field"]
                 expected_value = condition["value"]
                 actual_value = rating_result.get(field_name)
@@ -138,30 +219,15 @@ def get_score_interpretation(
                 condition_met = False
                 if isinstance(expected_value, bool):
                     # Handle various truthy/falsy representations including JSON strings
-                    if expected_value:  # Expected True
-                        condition_met = actual_value in [
-                            True,
-                            "true",
-                            "True",
-                            1,
-                            "1",
-                        ] or (
-                            isinstance(actual_value, str)
-                            and actual_value.lower() == "true"
-                        )
+                    if isinstance(actual_value, str):
+                        actual_value = actual_value.lower()
+                    if isinstance(actual_value, (dict, list)):
+                        # Unhashable values never match a boolean condition
+                        condition_met = False
+                    elif expected_value:  # Expected True
+                        condition_met = actual_value in _TRUTHY
                     else:  # Expected False
-                        condition_met = actual_value in [
-                            False,
-                            "false",
-                            "False",
-                            0,
-                            "0",
-                            None,
-                            "",
-                        ] or (
-                            isinstance(actual_value, str)
-                            and actual_value.lower() == "false"
-                        )
+                        condition_met = actual_value in _FALSY
                 else:
                     # For non-boolean values, use direct comparison
                     condition_met = actual_value == expected_value
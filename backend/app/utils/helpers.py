@@ -3,12 +3,32 @@ Miscellaneous helper functions
 """
 
 import re
-from datetime import datetime, timezone
-from typing import Optional, Union, Dict, Any
+from bisect import bisect_left
+from collections.abc import Iterable, Sequence, Sized
+from datetime import date, datetime, timezone
+from itertools import islice
+from typing import Final, Optional, Union, Dict, Any
 import hashlib
 import secrets
 
 
+_EMAIL_RE = re.compile(r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$")
+_UNSAFE_FILENAME_CHARS_RE = re.compile(r'[<>:"/\\|?*]')
+
+# PBKDF2 work factor for hash_password
+_PBKDF2_ITERATIONS = 100_000
+
+# Maximum possible score per survey type, used by format_survey_score
+_SCORE_RANGES: Final[Dict[str, int]] = {
+    "AUDIT": 40,
+    "PSQI": 21,
+    "BDI": 63,
+    "BAI": 63,
+    "K-MDQ": 16,  # Simplified range
+}
+_DEFAULT_MAX_SCORE: Final = 100
+
+
 def format_datetime_iso(dt: datetime) -> str:
     """
     Format datetime to ISO 8601 string
@@ -50,8 +70,7 @@ def validate_email(email: str) -> bool:
     Returns:
         bool: True if valid email format
     """
-    pattern = r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$"
-    return bool(re.match(pattern, email))
+    return bool(_EMAIL_RE.match(email))
 
 
 def validate_medical_record_number(mrn: str) -> bool:
@@ -85,7 +104,7 @@ def generate_secure_token(length: int = 32) -> str:
 
 def hash_password(password: str, salt: Optional[str] = None) -> tuple[str, str]:
     """
-    Hash password with salt (for additional security if needed)
+    Hash password with salt using PBKDF2-HMAC-SHA256 (for additional security if needed)
 
     Args:
         password: Password to hash
@@ -97,8 +116,9 @@ def hash_password(password: str, salt: Optional[str] = None) -> tuple[str, str]:
     if salt is None:
         salt = secrets.token_hex(16)
 
-    combined = f"{password}{salt}"
-    hashed = hashlib.sha256(combined.encode()).hexdigest()
+    hashed = hashlib.pbkdf2_hmac(
+        "sha256", password.encode(), salt.encode(), _PBKDF2_ITERATIONS
+    ).hex()
 
     return hashed, salt
 
@@ -114,7 +134,7 @@ def sanitize_filename(filename: str) -> str:
         str: Sanitized filename
     """
     # Remove or replace unsafe characters
-    filename = re.sub(r'[<>:"/\\|?*]', "_", filename)
+    filename = _UNSAFE_FILENAME_CHARS_RE.sub("_", filename)
     # Remove leading/trailing spaces and dots
     filename = filename.strip(" .")
     # Limit length
@@ -138,7 +158,7 @@ def mask_sensitive_data(data: str, visible_chars: int = 4) -> str:
     if not data or len(data) <= visible_chars:
         return "*" * len(data) if data else ""
 
-    return data[:visible_chars] + "*" * (len(data) - visible_chars)
+    return data[:visible_chars].ljust(len(data), "*")
 
 
 def calculate_age_from_birthdate(birthdate: Union[str, datetime]) -> Optional[int]:
@@ -153,17 +173,21 @@ def calculate_age_from_birthdate(birthdate: Union[str, datetime]) -> Optional[in
     """
     try:
         if isinstance(birthdate, str):
-            birth_dt = datetime.strptime(birthdate, "%Y-%m-%d")
+            # fromisoformat also accepts "19900105" and week dates such as
+            # "1990-W01-1", so only zero-padded YYYY-MM-DD takes the fast path
+            if len(birthdate) == 10 and birthdate[4] == birthdate[7] == "-":
+                birth_dt = date.fromisoformat(birthdate)
+            else:
+                # Non zero-padded dates such as "1990-1-5"
+                birth_dt = datetime.strptime(birthdate, "%Y-%m-%d")
         else:
             birth_dt = birthdate
 
-        today = datetime.now()
+        today = date.today()
         age = today.year - birth_dt.year
 
         # Adjust if birthday hasn't occurred this year
-        if today.month < birth_dt.month or (
-            today.month == birth_dt.month and today.day < birth_dt.day
-        ):
+        if (today.month, today.day) < (birth_dt.month, birth_dt.day):
             age -= 1
 
         return age if age >= 0 else None
@@ -183,16 +207,8 @@ def format_survey_score(score: float, survey_type: str) -> str:
     Returns:
         str: Formatted score string
     """
-    score_ranges = {
-        "AUDIT": 40,
-        "PSQI": 21,
-        "BDI": 63,
-        "BAI": 63,
-        "K-MDQ": 16,  # Simplified range
-    }
-
-    max_score = score_ranges.get(survey_type, 100)
-    percentage = (score / max_score) * 100 if max_score > 0 else 0
+    max_score = _SCORE_RANGES.get(survey_type, _DEFAULT_MAX_SCORE)
+    percentage = (score / max_score) * 100
 
     return f"{score:.1f}/{max_score} ({percentage:.1f}%)"
 
@@ -210,14 +226,9 @@ def clean_text_for_csv(text: str) -> str:
     if not text:
         return ""
 
-    # Replace newlines with spaces
-    text = text.replace("\n", " ").replace("\r", " ")
-    # Replace commas with semicolons to avoid CSV issues
-    text = text.replace(",", ";")
-    # Remove excessive whitespace
-    text = " ".join(text.split())
-
-    return text
+    # Replace commas with semicolons to avoid CSV issues, then collapse
+    # newlines and excessive whitespace (split() covers \n and \r too)
+    return " ".join(text.replace(",", ";").split())
 
 
 def validate_date_range(start_date: str, end_date: str) -> bool:
@@ -284,19 +295,28 @@ def extract_error_message(exception: Exception) -> str:
     return "An unexpected error occurred. Please try again or contact support"
 
 
-def paginate_results(items: list, page: int = 1, page_size: int = 20) -> Dict[str, Any]:
+def paginate_results(
+    items: Iterable,
+    page: int = 1,
+    page_size: int = 20,
+    total_items: Optional[int] = None,
+) -> Dict[str, Any]:
     """
-    Paginate a list of items
+    Paginate a list (or any iterable) of items
 
     Args:
-        items: List of items to paginate
+        items: Items to paginate; non-sequence iterables are consumed lazily
         page: Page number (1-based)
         page_size: Number of items per page
+        total_items: Known total count, lets streamed results skip materialization
 
     Returns:
         Dict: Paginated results with metadata
     """
-    total_items = len(items)
+    if total_items is None:
+        if not isinstance(items, Sized):
+            items = list(items)
+        total_items = len(items)
     total_pages = (total_items + page_size - 1) // page_size
 
     # Ensure page is within valid range
@@ -305,7 +325,10 @@ def paginate_results(items: list, page: int = 1, page_size: int = 20) -> Dict[st
     start_idx = (page - 1) * page_size
     end_idx = start_idx + page_size
 
-    paginated_items = items[start_idx:end_idx]
+    if isinstance(items, Sequence):
+        paginated_items = items[start_idx:end_idx]
+    else:
+        paginated_items = list(islice(items, start_idx, end_idx))
 
     return {
         "items": paginated_items,
@@ -318,3 +341,44 @@ def paginate_results(items: list, page: int = 1, page_size: int = 20) -> Dict[st
             "has_previous": page > 1,
         },
     }
+
+
+def build_range_index(
+    ranges: Iterable[Sequence[Optional[float]]],
+) -> Optional[tuple[list, list]]:
+    """
+    Build a bisect index over score ranges
+
+    Args:
+        ranges: (low, high) pairs in criteria order; a high of None is unbounded
+
+    Returns:
+        Optional[tuple[list, list]]: (lows, highs) for find_range, or None unless
+            the ranges are non-empty, sorted and disjoint (callers then scan in order)
+    """
+    lows, highs = [], []
+    for low, high in ranges:
+        high = float("inf") if high is None else high
+        if low > high or (highs and low <= highs[-1]):
+            return None
+        lows.append(low)
+        highs.append(high)
+    return (lows, highs) if lows else None
+
+
+def find_range(index: tuple[list, list], score: float) -> Optional[int]:
+    """
+    Find the range containing a score
+
+    Args:
+        index: (lows, highs) from build_range_index
+        score: Score to look up
+
+    Returns:
+        Optional[int]: Position of the matching range, or None if score falls in a gap
+    """
+    lows, highs = index
+    i = bisect_left(highs, score)
+    if i < len(highs) and lows[i] <= score:
+        return i
+    return None
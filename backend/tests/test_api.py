@@ -3,7 +3,6 @@ Integration tests for API endpoints
 """
 
 import pytest
-from unittest.mock import patch, Mock
 from fastapi.testclient import TestClient
 
 
@@ -11,33 +10,33 @@ class TestSurveyEndpoints:
     """Test survey-related endpoints"""
 
     def test_submit_survey_success(
-        self, client: TestClient, mock_firebase_service, sample_survey_responses
+        self,
+        client: TestClient,
+        mock_firebase_service,
+        score_result_stub,
+        bdi_responses,
     ):
         """Test successful survey submission"""
         # Arrange
         survey_data = {
             "patient_id": "test_patient_123",
             "survey_type": "BDI",
-            "responses": sample_survey_responses["BDI"],
+            "responses": bdi_responses,
+            "timestamp": "2024-01-01T00:00:00Z",
             "token": "valid_patient_token",
         }
 
-        mock_firebase_service.save_survey_result.return_value = "survey_123"
+        score_result_stub.update(total_score=21.0, llm_report="Test summary")
 
-        with patch("app.services.scoring.score_survey") as mock_score:
-            mock_score.return_value = 21.0
-            with patch("app.services.llm.llm_service.generate_summary") as mock_llm:
-                mock_llm.return_value = "Test summary"
-
-                # Act
-                response = client.post("/api/v1/survey/submit", json=survey_data)
+        # Act
+        response = client.post("/api/v1/survey/submit", json=survey_data)
 
-                # Assert
-                assert response.status_code == 200
-                data = response.json()
-                assert data["survey_id"] == "survey_123"
-                assert data["score"] == 21.0
-                assert data["summary"] == "Test summary"
+        # Assert
+        assert response.status_code == 200
+        data = response.json()
+        assert data["survey_id"] == "survey_123"
+        assert data["score"] == 21.0
+        assert data["summary"] == "Test summary"
 
     def test_submit_survey_unauthorized(self, client: TestClient):
         """Test survey submission with invalid token"""
@@ -155,7 +154,6 @@ class TestUserEndpoints:
 
     def test_update_user_profile(self, client: TestClient, mock_firebase_service):
         """Test updating user profile"""
-        mock_firebase_service.update_user_profile.return_value = True
 
         update_data = {"demographic_info": {"name": "Updated Name", "age": 31}}
 
@@ -3,119 +3,121 @@ Tests for authentication endpoints
 """
 
 import pytest
-from unittest.mock import patch, AsyncMock
 from fastapi.testclient import TestClient
 
 
 class TestAuthEndpoints:
     """Test class for authentication endpoints"""
 
-    def test_login_success(self, client: TestClient, mock_firebase_service):
-        """Test successful login"""
+    @pytest.mark.parametrize(
+        "login_data, verify_return, expected_status, expected_detail",
+        [
+            pytest.param(
+                {
+                    "user_id": "test_patient_123",
+                    "password": "test_password",
+                    "user_type": "patient",
+                },
+                True,
+                200,
+                None,
+                id="success",
+            ),
+            pytest.param(
+                {
+                    "user_id": "test_patient_123",
+                    "password": "wrong_password",
+                    "user_type": "patient",
+                },
+                False,
+                401,
+                "Invalid credentials",
+                id="invalid_credentials",
+            ),
+            pytest.param(
+                {
+                    "user_id": "test_patient_123",
+                    "password": "test_password",
+                    "user_type": "clinician",  # Wrong type
+                },
+                True,
+                401,
+                "Invalid user type",
+                id="user_type_mismatch",
+            ),
+        ],
+    )
+    def test_login(
+        self,
+        client: TestClient,
+        mock_firebase_service,
+        login_data,
+        verify_return,
+        expected_status,
+        expected_detail,
+    ):
+        """Test login success, invalid credentials and user type mismatch"""
         # Arrange
-        login_data = {
-            "user_id": "test_patient_123",
-            "password": "test_password",
-            "user_type": "patient",
-        }
-
-        mock_firebase_service.verify_password.return_value = True
-        mock_firebase_service.get_user_profile.return_value = {
-            "user_id": "test_patient_123",
-            "user_type": "patient",
-            "password": "test_password",
-        }
+        # The default profile is a patient with password "test_password"
+        mock_firebase_service.verify_password.return_value = verify_return
 
         # Act
         response = client.post("/api/v1/auth/login", json=login_data)
 
         # Assert
-        assert response.status_code == 200
+        assert response.status_code == expected_status
         data = response.json()
-        assert "token" in data
-        assert data["user_id"] == "test_patient_123"
-        assert data["user_type"] == "patient"
-
-    def test_login_invalid_credentials(self, client: TestClient, mock_firebase_service):
-        """Test login with invalid credentials"""
-        # Arrange
-        login_data = {
-            "user_id": "test_patient_123",
-            "password": "wrong_password",
-            "user_type": "patient",
-        }
-
-        mock_firebase_service.verify_password.return_value = False
-
-        # Act
-        response = client.post("/api/v1/auth/login", json=login_data)
-
-        # Assert
-        assert response.status_code == 401
-        assert "Invalid credentials" in response.json()["detail"]
-
-    def test_login_user_type_mismatch(self, client: TestClient, mock_firebase_service):
-        """Test login with wrong user type"""
-        # Arrange
-        login_data = {
-            "user_id": "test_patient_123",
-            "password": "test_password",
-            "user_type": "clinician",  # Wrong type
-        }
-
-        mock_firebase_service.verify_password.return_value = True
-        mock_firebase_service.get_user_profile.return_value = {
-            "user_id": "test_patient_123",
-            "user_type": "patient",  # Actual type
-            "password": "test_password",
-        }
-
-        # Act
-        response = client.post("/api/v1/auth/login", json=login_data)
-
-        # Assert
-        assert response.status_code == 401
-        assert "Invalid user type" in response.json()["detail"]
-
-    def test_update_password_success(self, client: TestClient, mock_firebase_service):
-        """Test successful password update"""
-        # Arrange
-        update_data = {
-            "user_id": "test_patient_123",
-            "current_password": "old_password",
-            "new_password": "new_password",
-        }
-
-        mock_firebase_service.verify_password.return_value = True
-        mock_firebase_service.update_password.return_value = True
-        mock_firebase_service.update_user_profile.return_value = True
-
-        # Act
-        response = client.post("/api/v1/auth/patient/update-password", json=update_data)
-
-        # Assert
-        assert response.status_code == 200
-        assert response.json()["message"] == "Password updated successfully"
-
-    def test_update_password_invalid_current(
-        self, client: TestClient, mock_firebase_service
+        if expected_detail is None:
+            assert "token" in data
+            assert data["user_id"] == login_data["user_id"]
+            assert data["user_type"] == login_data["user_type"]
+        else:
+            assert expected_detail in data["detail"]
+
+    @pytest.mark.parametrize(
+        "current_password, verify_return, expected_status, expected_message",
+        [
+            pytest.param(
+                "old_password", True, 200, "Password updated successfully", id="success"
+            ),
+            pytest.param(
+                "wrong_password",
+                False,
+                401,
+                "Invalid current password",
+                id="invalid_current",
+            ),
+        ],
+    )
+    def test_update_password(
+        self,
+        client: TestClient,
+        mock_firebase_service,
+        current_password,
+        verify_return,
+        expected_status,
+        expected_message,
     ):
-        """Test password update with invalid current password"""
+        """Test password update with valid and invalid current passwords"""
         # Arrange
         update_data = {
             "user_id": "test_patient_123",
-            "current_password": "wrong_password",
+            "current_password": current_password,
             "new_password": "new_password",
         }
 
-        mock_firebase_service.verify_password.return_value = False
+        mock_firebase_service.verify_password.return_value = verify_return
 
         # Act
         response = client.post("/api/v1/auth/patient/update-password", json=update_data)
 
         # Assert
-        assert response.status_code == 401
-        assert "Invalid current password" in response.json()["detail"]
+        assert response.status_code == expected_status
+        data = response.json()
+        if expected_status == 200:
+            assert data["message"] == expected_message
+        else:
+            assert expected_message in data["detail"]
 
     def test_register_clinician_success(
         self, client: TestClient, mock_firebase_service
@@ -130,21 +132,15 @@ class TestAuthEndpoints:
 
         mock_firebase_service.get_user_profile.return_value = None  # User doesn't exist
         mock_firebase_service.create_user.return_value = "new_clinician@test.com"
-        mock_firebase_service.create_user_profile.return_value = True
 
-        with patch("app.dependencies.auth.verify_admin_token") as mock_verify_admin:
-            mock_verify_admin.return_value = True
-
-            # Act
-            response = client.post(
-                "/api/v1/auth/clinician/register", json=register_data
-            )
+        # Act
+        response = client.post("/api/v1/auth/clinician/register", json=register_data)
 
-            # Assert
-            assert response.status_code == 201
-            data = response.json()
-            assert data["message"] == "Clinician registered successfully"
-            assert data["clinician_id"] == "new_clinician@test.com"
+        # Assert
+        assert response.status_code == 201
+        data = response.json()
+        assert data["message"] == "Clinician registered successfully"
+        assert data["clinician_id"] == "new_clinician@test.com"
 
     def test_register_clinician_already_exists(
         self, client: TestClient, mock_firebase_service
@@ -161,19 +157,16 @@ class TestAuthEndpoints:
             "user_id": "existing@test.com"
         }
 
-        with patch("app.dependencies.auth.verify_admin_token") as mock_verify_admin:
-            mock_verify_admin.return_value = True
-
-            # Act
-            response = client.post(
-                "/api/v1/auth/clinician/register", json=register_data
-            )
+        # Act
+        response = client.post("/api/v1/auth/clinician/register", json=register_data)
 
-            # Assert
-            assert response.status_code == 409
-            assert "already exists" in response.json()["detail"]
+        # Assert
+        assert response.status_code == 409
+        assert "already exists" in response.json()["detail"]
 
-    def test_register_clinician_invalid_admin_token(self, client: TestClient):
+    def test_register_clinician_invalid_admin_token(
+        self, client: TestClient, admin_token_stub
+    ):
         """Test clinician registration with invalid admin token"""
         # Arrange
         register_data = {
@@ -182,41 +175,34 @@ class TestAuthEndpoints:
             "password": "password",
         }
 
-        with patch("app.dependencies.auth.verify_admin_token") as mock_verify_admin:
-            mock_verify_admin.side_effect = Exception("Invalid admin token")
+        admin_token_stub.side_effect = Exception("Invalid admin token")
 
-            # Act
-            response = client.post(
-                "/api/v1/auth/clinician/register", json=register_data
-            )
+        # Act
+        response = client.post("/api/v1/auth/clinician/register", json=register_data)
 
-            # Assert
-            assert response.status_code == 500
+        # Assert
+        assert response.status_code == 500
 
     def test_register_patient_success(self, client: TestClient, mock_firebase_service):
         """Test successful patient registration"""
         # Arrange
         mock_firebase_service.get_user_profile.return_value = None
-        mock_firebase_service.create_user_profile.return_value = True
-
-        with patch("app.dependencies.auth.verify_admin_token") as mock_verify_admin:
-            mock_verify_admin.return_value = True
-
-            # Act
-            response = client.post(
-                "/api/v1/auth/patient/register",
-                params={
-                    "user_id": "new_patient_123",
-                    "password": "patient_password",
-                    "admin_token": "valid_admin_token",
-                },
-            )
 
-            # Assert
-            assert response.status_code == 200
-            data = response.json()
-            assert data["message"] == "Patient registered successfully"
-            assert data["patient_id"] == "new_patient_123"
+        # Act
+        response = client.post(
+            "/api/v1/auth/patient/register",
+            params={
+                "user_id": "new_patient_123",
+                "password": "patient_password",
+                "admin_token": "valid_admin_token",
+            },
+        )
+
+        # Assert
+        assert response.status_code == 200
+        data = response.json()
+        assert data["message"] == "Patient registered successfully"
+        assert data["patient_id"] == "new_patient_123"
 
     def test_missing_required_fields(self, client: TestClient):
         """Test API calls with missing required fields"""
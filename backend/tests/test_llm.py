@@ -0,0 +1,113 @@
+"""
+Tests for LLM report generation
+"""
+
+import pytest
+import httpx
+from datetime import datetime
+
+from app.services import llm
+
+
+class _FakeAsyncClient:
+    """Stand-in for httpx.AsyncClient that answers posts with queued LLM texts"""
+
+    def __init__(self):
+        self.texts = []
+        self.prompts = []
+
+    def __call__(self, *args, **kwargs):
+        return self
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        return False
+
+    async def post(self, url, json=None, headers=None):
+        self.prompts.append(json["contents"][0]["parts"][0]["text"])
+        text = self.texts.pop(0)
+        return httpx.Response(
+            200, json={"candidates": [{"content": {"parts": [{"text": text}]}}]}
+        )
+
+
+@pytest.fixture(autouse=True)
+def clear_report_cache():
+    """Start every test with an empty report cache"""
+    llm._report_cache.clear()
+    yield
+    llm._report_cache.clear()
+
+
+class TestReportCache:
+    """Test the single-scale report cache"""
+
+    def test_cache_key_is_sha256_of_inputs(self):
+        """Test that the key is a SHA-256 hexdigest that differs per patient rating"""
+        key = llm._report_cache_key({"q1": 1}, "BDI", {"total_score": 1})
+
+        assert len(key) == 64
+        assert key == llm._report_cache_key({"q1": 1}, "BDI", {"total_score": 1})
+        assert key != llm._report_cache_key({"q1": 2}, "BDI", {"total_score": 1})
+
+    def test_cached_report_is_returned(self):
+        """Test that a stored report is served until it expires"""
+        llm._cache_report("key", "report")
+
+        assert llm._get_cached_report("key") == "report"
+
+    def test_expired_report_is_evicted_on_read(self):
+        """Test that an expired report is removed instead of served"""
+        llm._cache_report("key", "report")
+        llm._report_cache["key"]["timestamp"] = datetime.now() - llm._CACHE_EXPIRY
+
+        assert llm._get_cached_report("key") is None
+        assert "key" not in llm._report_cache
+
+    def test_expired_reports_are_evicted_on_write(self):
+        """Test that storing a report drops every expired entry"""
+        llm._cache_report("stale", "old report")
+        llm._report_cache["stale"]["timestamp"] = datetime.now() - llm._CACHE_EXPIRY
+
+        llm._cache_report("fresh", "new report")
+
+        assert list(llm._report_cache) == ["fresh"]
+
+    def test_least_recently_used_report_is_evicted(self, monkeypatch):
+        """Test that the cache is bounded and evicts the least recently used report"""
+        monkeypatch.setattr(llm, "_REPORT_CACHE_MAXSIZE", 2)
+        llm._cache_report("first", "report 1")
+        llm._cache_report("second", "report 2")
+
+        # Reading "first" makes "second" the least recently used
+        llm._get_cached_report("first")
+        llm._cache_report("third", "report 3")
+
+        assert list(llm._report_cache) == ["first", "third"]
+
+
+@pytest.fixture
+def llm_client(monkeypatch):
+    """Route LLM requests to a fake HTTP client with an API key configured"""
+    client = _FakeAsyncClient()
+    monkeypatch.setattr(llm.settings, "GOOGLE_API_KEY", "test-key")
+    monkeypatch.setattr(llm.httpx, "AsyncClient", client)
+    return client
+
+
+class TestLLMConnectionEndpoint:
+    """Test the /test-llm connectivity check"""
+
+    def test_every_check_calls_the_llm(self, client, llm_client):
+        """Test that repeated checks are never answered from the report cache"""
+        llm_client.texts = ["first report", "second report"]
+
+        first = client.get("/api/v1/survey/test-llm").json()
+        second = client.get("/api/v1/survey/test-llm").json()
+
+        assert len(llm_client.prompts) == 2
+        assert first["report_preview"].startswith("first report")
+        assert second["report_preview"].startswith("second report")
+        assert not llm._report_cache
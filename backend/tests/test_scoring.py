@@ -3,298 +3,248 @@ Tests for scoring algorithms
 """
 
 import pytest
-from app.services.scoring import (
-    score_survey,
-    score_audit,
-    score_psqi,
-    score_bdi,
-    score_bai,
-    score_k_mdq,
-    get_score_interpretation,
-    _convert_to_numeric,
-)
+from app.services.scoring import _numeric_sum, get_score_interpretation
+
+# Question keys, built once for the response dicts below
+AUDIT_KEYS = tuple(f"audit-{i:02d}" for i in range(1, 11))
+BDI_KEYS = tuple(f"bdi-{i:02d}" for i in range(1, 22))
+KMDQ_Q_KEYS = tuple(f"q{i}" for i in range(1, 14))
+
+# Shared AUDIT/BDI/BAI responses. Plain dicts, since scoring only sums dict
+# values; tests must not modify them
+AUDIT_ZERO = dict.fromkeys(AUDIT_KEYS, "0")
+AUDIT_MAX = dict.fromkeys(AUDIT_KEYS, "4")
+AUDIT_MIXED = {
+    **AUDIT_ZERO,
+    "audit-01": "2",
+    "audit-02": "2",
+    "audit-03": "1",
+    "audit-04": "1",
+}
+BDI_ZERO = dict.fromkeys(BDI_KEYS, "0")
+BDI_ONE = dict.fromkeys(BDI_KEYS, "1")
+BDI_MAX = dict.fromkeys(BDI_KEYS, "3")
+# BAI has the same 21 questions as BDI
+BAI_MILD = {**dict.fromkeys(BDI_KEYS[:10], "1"), **dict.fromkeys(BDI_KEYS[10:], "0")}
+
+# PSQI responses from the psqi_scoring example (total score 5)
+PSQI_GOOD_SLEEP = {
+    "hour_to_goto_sleep": 22,
+    "sleep_onset": "0",
+    "wakeup_time": 6,
+    "sleep_duration": 6,
+    "psqi_sleep_disturbances": {
+        "a": 0,
+        "b": 0,
+        "c": 2,
+        "d": 0,
+        "e": 2,
+        "f": 0,
+        "g": 0,
+        "h": 0,
+        "i": 2,
+        "j": 0,
+    },
+    "sleep_quality": 1,
+    "sleep_medication": 1,
+    "daytime_dysfunction": 0,
+    "daytime_motivation": 0,
+}
+PSQI_POOR_SLEEP = {
+    **PSQI_GOOD_SLEEP,
+    "sleep_onset": "45",
+    "sleep_duration": 4,
+    "sleep_quality": 3,
+    "daytime_dysfunction": 2,
+    "daytime_motivation": 2,
+}
+
+
+def _score(responses, scale_name, gender=None):
+    """Score responses without generating an LLM report"""
+    return get_score_interpretation(
+        responses, scale_name, gender, generate_llm_report=False
+    )
 
 
 class TestScoringAlgorithms:
     """Test class for scoring algorithms"""
 
-    def test_score_audit(self):
+    @pytest.mark.parametrize(
+        "responses, expected",
+        [
+            pytest.param(AUDIT_ZERO, 0, id="all_zero"),
+            pytest.param(AUDIT_MAX, 40, id="all_four"),
+            pytest.param(AUDIT_MIXED, 6, id="mixed"),
+        ],
+    )
+    def test_score_audit(self, responses, expected):
         """Test AUDIT scoring algorithm"""
-        # Test perfect score (all 0s)
-        responses = {f"q{i}": "0" for i in range(1, 11)}
-        score = score_audit(responses)
-        assert score == 0.0
-
-        # Test maximum score (all 4s)
-        responses = {f"q{i}": "4" for i in range(1, 11)}
-        score = score_audit(responses)
-        assert score == 40.0
-
-        # Test mixed responses
-        responses = {
-            "q1": "2",
-            "q2": "2",
-            "q3": "1",
-            "q4": "1",
-            "q5": "0",
-            "q6": "0",
-            "q7": "0",
-            "q8": "0",
-            "q9": "0",
-            "q10": "0",
-        }
-        score = score_audit(responses)
-        assert score == 6.0
-
-    def test_score_bdi(self):
+        assert _score(responses, "AUDIT", "남")["total_score"] == expected
+
+    @pytest.mark.parametrize(
+        "responses, expected",
+        [
+            pytest.param(BDI_ZERO, 0, id="minimum"),
+            pytest.param(BDI_MAX, 63, id="maximum"),
+            pytest.param(BDI_ONE, 21, id="mixed"),
+        ],
+    )
+    def test_score_bdi(self, responses, expected):
         """Test BDI scoring algorithm"""
-        # Test minimum score
-        responses = {f"q{i}": "0" for i in range(1, 22)}
-        score = score_bdi(responses)
-        assert score == 0.0
-
-        # Test maximum score
-        responses = {f"q{i}": "3" for i in range(1, 22)}
-        score = score_bdi(responses)
-        assert score == 63.0
-
-        # Test mixed responses
-        responses = {f"q{i}": "1" for i in range(1, 22)}
-        score = score_bdi(responses)
-        assert score == 21.0
-
-    def test_score_bai(self):
+        assert _score(responses, "BDI")["total_score"] == expected
+
+    @pytest.mark.parametrize(
+        "responses, expected",
+        [
+            pytest.param(BDI_ZERO, 0, id="minimum"),
+            pytest.param(BDI_MAX, 63, id="maximum"),
+            pytest.param(BAI_MILD, 10, id="mild_anxiety"),
+        ],
+    )
+    def test_score_bai(self, responses, expected):
         """Test BAI scoring algorithm"""
-        # Test minimum score
-        responses = {f"q{i}": "0" for i in range(1, 22)}
-        score = score_bai(responses)
-        assert score == 0.0
-
-        # Test maximum score
-        responses = {f"q{i}": "3" for i in range(1, 22)}
-        score = score_bai(responses)
-        assert score == 63.0
-
-        # Test mild anxiety
-        responses = {f"q{i}": "1" for i in range(1, 11)}  # 10 questions with score 1
-        responses.update({f"q{i}": "0" for i in range(11, 22)})  # Rest with score 0
-        score = score_bai(responses)
-        assert score == 10.0
-
-    def test_score_psqi(self):
+        assert _score(responses, "BAI")["total_score"] == expected
+
+    @pytest.mark.parametrize(
+        "responses, expected, expected_interpretation",
+        [
+            pytest.param(PSQI_GOOD_SLEEP, 5, "좋은 수면", id="good_sleep"),
+            pytest.param(PSQI_POOR_SLEEP, 14, "나쁜 수면", id="poor_sleep"),
+        ],
+    )
+    def test_score_psqi(self, responses, expected, expected_interpretation):
         """Test PSQI scoring algorithm"""
-        # Test minimum score
-        responses = {
-            "sleep_quality": "0",
-            "sleep_latency": "0",
-            "sleep_duration": "0",
-            "sleep_efficiency": "0",
-            "sleep_disturbances": "0",
-            "sleep_medication": "0",
-            "daytime_dysfunction": "0",
-        }
-        score = score_psqi(responses)
-        assert score == 0.0
-
-        # Test maximum score
-        responses = {
-            "sleep_quality": "3",
-            "sleep_latency": "3",
-            "sleep_duration": "3",
-            "sleep_efficiency": "3",
-            "sleep_disturbances": "3",
-            "sleep_medication": "3",
-            "daytime_dysfunction": "3",
-        }
-        score = score_psqi(responses)
-        assert score == 21.0
-
-        # Test mixed responses
-        responses = {
-            "sleep_quality": "1",
-            "sleep_latency": "1",
-            "sleep_duration": "1",
-            "sleep_efficiency": "1",
-            "sleep_disturbances": "1",
-            "sleep_medication": "1",
-            "daytime_dysfunction": "1",
-        }
-        score = score_psqi(responses)
-        assert score == 7.0
-
-    def test_score_k_mdq(self):
+        result = _score(responses, "PSQI")
+
+        assert result["total_score"] == expected
+        assert sum(result["subscores"].values()) == expected
+        assert result["interpretation"] == expected_interpretation
+
+    @pytest.mark.parametrize(
+        "responses, expected",
+        [
+            pytest.param(
+                {**dict.fromkeys(KMDQ_Q_KEYS, "0"), "simultaneity": "아니오"},
+                0,
+                id="minimum",
+            ),
+            pytest.param(
+                {
+                    **dict.fromkeys(KMDQ_Q_KEYS[:7], "1"),  # 7 yes answers
+                    **dict.fromkeys(KMDQ_Q_KEYS[7:], "0"),  # Rest no
+                    "simultaneity": "예",
+                },
+                7,
+                id="positive_screen",
+            ),
+            pytest.param(
+                {
+                    **dict.fromkeys(KMDQ_Q_KEYS[:5], 1),  # 5 yes (as 1)
+                    **dict.fromkeys(KMDQ_Q_KEYS[5:], 0),  # Rest no (as 0)
+                },
+                5,
+                id="numeric_responses",
+            ),
+        ],
+    )
+    def test_score_k_mdq(self, responses, expected):
         """Test K-MDQ scoring algorithm"""
-        # Test minimum score
-        responses = {
-            **{f"q{i}": "no" for i in range(1, 14)},
-            "clustering": False,
-            "impairment": "0",
-        }
-        score = score_k_mdq(responses)
-        assert score == 0.0
-
-        # Test positive screen
-        responses = {
-            **{f"q{i}": "yes" for i in range(1, 8)},  # 7 yes answers
-            **{f"q{i}": "no" for i in range(8, 14)},  # Rest no
-            "clustering": True,
-            "impairment": "2",
-        }
-        score = score_k_mdq(responses)
-        assert score == 10.0  # 7 + 1 + 2
-
-        # Test with numeric responses
-        responses = {
-            **{f"q{i}": 1 for i in range(1, 6)},  # 5 yes (as 1)
-            **{f"q{i}": 0 for i in range(6, 14)},  # Rest no (as 0)
-            "clustering": 1,
-            "impairment": 3,
-        }
-        score = score_k_mdq(responses)
-        assert score == 9.0  # 5 + 1 + 3
-
-    def test_convert_to_numeric(self):
-        """Test numeric conversion helper function"""
-        # Test string mappings
-        assert _convert_to_numeric("never") == 0
-        assert _convert_to_numeric("sometimes") == 1
-        assert _convert_to_numeric("often") == 2
-        assert _convert_to_numeric("always") == 3
+        assert _score(responses, "K-MDQ")["total_score"] == expected
 
+    def test_numeric_sum(self):
+        """Test the response summing helper"""
         # Test numeric strings
-        assert _convert_to_numeric("0") == 0
-        assert _convert_to_numeric("3") == 3
-        assert _convert_to_numeric("5", max_value=3) == 3  # Clamped to max
+        assert _numeric_sum({"q1": "0", "q2": "3"}) == 3
+        assert _numeric_sum({"q1": "12", "q2": " 4 "}) == 16
 
         # Test numeric values
-        assert _convert_to_numeric(2) == 2
-        assert _convert_to_numeric(2.5) == 2
-
-        # Test invalid values
-        assert _convert_to_numeric("invalid") == 0
-        assert _convert_to_numeric(None) == 0
-
-        # Test yes/no responses
-        assert _convert_to_numeric("yes") == 1
-        assert _convert_to_numeric("no") == 0
-
-    def test_score_survey_dispatcher(self):
-        """Test the main score_survey function"""
-        # Test AUDIT
-        audit_responses = {f"q{i}": "1" for i in range(1, 11)}
-        score = score_survey("AUDIT", audit_responses)
-        assert score == 10.0
-
-        # Test BDI
-        bdi_responses = {f"q{i}": "1" for i in range(1, 22)}
-        score = score_survey("BDI", bdi_responses)
-        assert score == 21.0
-
-        # Test invalid survey type
-        with pytest.raises(Exception):
-            score_survey("INVALID_SURVEY", {})
-
-    def test_get_score_interpretation(self):
+        assert _numeric_sum({"q1": 2, "q2": 2.5}) == 4
+        assert _numeric_sum({"q1": True, "q2": False}) == 1
+
+        # Test nested dicts and lists
+        assert _numeric_sum({"q1": 1, "q2": {"a": 2, "b": [3, "4"]}}) == 10
+
+        # Test non-numeric values are ignored
+        assert _numeric_sum({"q1": "invalid", "q2": None, "q3": "예", "q4": 1}) == 1
+
+    @pytest.mark.parametrize(
+        "survey, score, gender, expected_category",
+        [
+            pytest.param("AUDIT", 5, "남", "정상음주", id="audit_male_normal"),
+            pytest.param("AUDIT", 15, "남", "위험음주", id="audit_male_risky"),
+            pytest.param("AUDIT", 25, "남", "알코올사용장애", id="audit_male_disorder"),
+            pytest.param("AUDIT", 3, "여", "정상음주", id="audit_female_normal"),
+            pytest.param("AUDIT", 7, "여", "위험음주", id="audit_female_risky"),
+            pytest.param("BDI", 8, None, "정상", id="bdi_normal"),
+            pytest.param("BDI", 12, None, "가벼운 우울", id="bdi_mild"),
+            pytest.param("BDI", 20, None, "중등도 우울", id="bdi_moderate"),
+            pytest.param("BDI", 30, None, "심한 우울", id="bdi_severe"),
+            pytest.param("BAI", 5, None, "정상", id="bai_normal"),
+            pytest.param("BAI", 10, None, "가벼운 불안", id="bai_mild"),
+            pytest.param("BAI", 20, None, "중등도 불안", id="bai_moderate"),
+            pytest.param("BAI", 30, None, "심한 불안", id="bai_severe"),
+        ],
+    )
+    def test_get_score_interpretation(self, survey, score, gender, expected_category):
         """Test score interpretation functions"""
-        # Test AUDIT interpretations with gender
-        result = get_score_interpretation("AUDIT", 5, gender="남")
-        assert result["category"] == "정상음주"
-
-        result = get_score_interpretation("AUDIT", 15, gender="남")
-        assert result["category"] == "위험음주"
-
-        result = get_score_interpretation("AUDIT", 25, gender="남")
-        assert result["category"] == "알코올사용장애"
-
-        # Test AUDIT interpretations for female
-        result = get_score_interpretation("AUDIT", 3, gender="여")
-        assert result["category"] == "정상음주"
-
-        result = get_score_interpretation("AUDIT", 7, gender="여")
-        assert result["category"] == "위험음주"
-
-        # Test BDI interpretations
-        result = get_score_interpretation("BDI", 8)
-        assert result["category"] == "정상"
-
-        result = get_score_interpretation("BDI", 12)
-        assert result["category"] == "가벼운 우울"
-
-        result = get_score_interpretation("BDI", 20)
-        assert result["category"] == "중등도 우울"
-
-        result = get_score_interpretation("BDI", 30)
-        assert result["category"] == "심한 우울"
-
-        # Test BAI interpretations
-        result = get_score_interpretation("BAI", 5)
-        assert result["category"] == "정상"
-
-        result = get_score_interpretation("BAI", 10)
-        assert result["category"] == "가벼운 불안"
-
-        result = get_score_interpretation("BAI", 20)
-        assert result["category"] == "중등도 불안"
-
-        result = get_score_interpretation("BAI", 30)
-        assert result["category"] == "심한 불안"
-
-        # Test AUDIT without gender (should show error)
-        result = get_score_interpretation("AUDIT", 10)
-        assert result["category"] == "미지원"
-        assert "Gender is required" in result["description"]
-
-        # Test PSQI interpretations (may not be in JSON, should fallback)
-        result = get_score_interpretation("PSQI", 3)
-        # Since PSQI may not be in the JSON file, it should either work or show error
-        assert "category" in result
-        assert "description" in result
-
-        # Test K-MDQ interpretations (needs additional conditions)
-        result = get_score_interpretation("K-MDQ", 5)
-        # Below threshold should be normal
-        assert "category" in result
+        result = _score({"q1": score}, survey, gender)
+        assert result["total_score"] == score
+        assert result["interpretation"].startswith(expected_category + " - ")
+
+    def test_get_score_interpretation_audit_without_gender(self):
+        """Test AUDIT interpretation without gender (should show error)"""
+        result = _score(AUDIT_MIXED, "AUDIT")
+        assert result == {"error": "성별이 필요한 도구입니다."}
+
+    def test_get_score_interpretation_psqi(self):
+        """Test PSQI interpretation (scored from its own components)"""
+        result = _score(PSQI_GOOD_SLEEP, "PSQI")
+        assert result["tool_name"] == "PSQI"
+        assert result["interpretation"] == "좋은 수면"
+
+    @pytest.mark.parametrize(
+        "yes_answers, simultaneity, expected_prefix",
+        [
+            pytest.param(
+                5, "예", "점수 범위를 확인할 수 없습니다.", id="below_threshold"
+            ),
+            pytest.param(7, "예", "조울증 의심 - ", id="positive_screen"),
+            pytest.param(7, "아니오", "조건 미충족 - ", id="not_simultaneous"),
+        ],
+    )
+    def test_get_score_interpretation_k_mdq(
+        self, yes_answers, simultaneity, expected_prefix
+    ):
+        """Test K-MDQ interpretation (needs additional conditions)"""
+        responses = {
+            **dict.fromkeys(KMDQ_Q_KEYS[:yes_answers], 1),
+            **dict.fromkeys(KMDQ_Q_KEYS[yes_answers:], 0),
+            "simultaneity": simultaneity,
+        }
+        result = _score(responses, "K-MDQ")
+        assert result["interpretation"].startswith(expected_prefix)
 
-        # Test unknown survey type
-        result = get_score_interpretation("UNKNOWN", 10)
-        assert result["category"] in ["미지원", "해석 불가"]
+    def test_get_score_interpretation_unknown_survey(self):
+        """Test unknown survey type"""
+        result = _score({"q1": 1}, "UNKNOWN")
+        assert result == {"error": "지원되지 않는 도구: UNKNOWN"}
 
     def test_edge_cases(self):
         """Test edge cases and error handling"""
         # Test empty responses
-        score = score_audit({})
-        assert score == 0.0
+        result = _score({}, "AUDIT", "남")
+        assert result["total_score"] == 0
+        assert result["interpretation"].startswith("정상음주 - ")
 
         # Test missing questions
-        responses = {"q1": "2", "q3": "1"}  # Missing q2
-        score = score_audit(responses)
-        assert score == 3.0
-
-        # Test extra questions (should be ignored)
-        responses = {f"q{i}": "1" for i in range(1, 15)}  # More than 10 questions
-        score = score_audit(responses)
-        assert score == 10.0  # Only first 10 counted
-
-        # Test extreme values
-        responses = {f"q{i}": "999" for i in range(1, 11)}
-        score = score_audit(responses)
-        assert score == 40.0  # Clamped to max value
-
-    def test_string_response_variations(self):
-        """Test various string response formats"""
-        # Test case insensitive
-        responses = ["NEVER", "Always", "SomeTimes"]
-        converted = [_convert_to_numeric(v) for v in responses]
-        assert converted == [0, 3, 1]
-
-        # Test with extra whitespace
-        responses = [" never ", " always ", " sometimes "]
-        converted = [_convert_to_numeric(v.strip()) for v in responses]
-        assert converted == [0, 3, 1]
+        responses = {"audit-01": "2", "audit-03": "1"}  # Missing audit-02
+        assert _score(responses, "AUDIT", "남")["total_score"] == 3
 
-        # Test boolean-like responses
-        assert _convert_to_numeric("true") == 1
-        assert _convert_to_numeric("false") == 0
+        # Test scores outside every range
+        result = _score(dict.fromkeys(BDI_KEYS, "999"), "BDI")
+        assert result["total_score"] == 999 * 21
+        assert result["interpretation"] == "점수 범위를 확인할 수 없습니다."
 
 
 class TestScoringConsistency:
@@ -302,35 +252,35 @@ class TestScoringConsistency:
 
     def test_scoring_deterministic(self):
         """Test that scoring is deterministic"""
-        responses = {f"q{i}": "2" for i in range(1, 11)}
+        responses = dict.fromkeys(AUDIT_KEYS, "2")
 
         # Score multiple times
-        scores = [score_audit(responses) for _ in range(5)]
+        results = [_score(responses, "AUDIT", "남") for _ in range(5)]
 
-        # All scores should be identical
-        assert all(score == scores[0] for score in scores)
-        assert scores[0] == 20.0
+        # All results should be identical
+        assert all(result == results[0] for result in results)
+        assert results[0]["total_score"] == 20
 
     def test_survey_type_case_sensitivity(self):
-        """Test that survey type handling is case insensitive where appropriate"""
-        responses = {f"q{i}": "1" for i in range(1, 11)}
+        """Test that survey type handling is case sensitive"""
+        responses = dict.fromkeys(AUDIT_KEYS, "1")
 
-        # These should work the same
-        score1 = score_survey("AUDIT", responses)
+        assert _score(responses, "AUDIT", "남")["total_score"] == 10
         # Note: Our current implementation is case sensitive
         # This test documents current behavior
-        with pytest.raises(Exception):
-            score_survey("audit", responses)  # lowercase should fail
-
-    def test_all_survey_types_covered(self):
-        """Test that all expected survey types have scoring functions"""
-        expected_surveys = ["AUDIT", "PSQI", "BDI", "BAI", "K-MDQ"]
-
-        for survey_type in expected_surveys:
-            # Should not raise an exception
-            try:
-                score_survey(survey_type, {})
-                # Success - scoring function exists
-            except Exception as e:
-                # Only allow scoring-related errors, not "unknown survey type"
-                assert "Unknown survey type" not in str(e)
+        assert "error" in _score(responses, "audit", "남")
+
+    @pytest.mark.parametrize(
+        "survey_type, gender",
+        [
+            ("AUDIT", "남"),
+            ("AUDIT", "여"),
+            ("BDI", None),
+            ("BAI", None),
+            ("K-MDQ", None),
+        ],
+    )
+    def test_all_survey_types_covered(self, survey_type, gender):
+        """Test that all expected survey types have scoring criteria"""
+        result = _score({}, survey_type, gender)
+        assert "error" not in result